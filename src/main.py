@@ -1,7 +1,9 @@
 import logging
 import os
+import queue
 import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict
 
 import yaml
@@ -9,28 +11,48 @@ import yaml
 from src.mqtt import MQTT
 # from src.plugins.aissens.packet_test import main as packet_test_main
 
+try:
+    # libyaml-backed loader, same semantics as yaml.safe_load
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
-logging.basicConfig(
-    # level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 
 
 def main():
-    config = load_config()
-    with MQTT(config) as mqtt:
-        try:
-            mqtt.join()
-        except KeyboardInterrupt:
-            logger.info("Service interrupted by user")
+    # Records are queued by the emitting thread and formatted/written by a
+    # listener thread, so MQTT and plugin threads never block on stream I/O
+    log_queue: queue.Queue = queue.Queue()
+    log_stream_handler = logging.StreamHandler()
+    log_stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    log_listener = QueueListener(log_queue, log_stream_handler)
+    logging.basicConfig(
+        # level=logging.INFO,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    log_listener.start()
+    try:
+        config = load_config()
+        with MQTT(config) as mqtt:
+            try:
+                mqtt.join()
+            except KeyboardInterrupt:
+                logger.info("Service interrupted by user")
+    finally:
+        # Flush any queued log records before exiting
+        log_listener.stop()
 
 
 def load_config(config_path: str = "config/config.yaml") -> Dict:
     try:
         # Try to open the config file
         with open(config_path, "r") as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=SafeLoader)
     except FileNotFoundError:
         # If not found in the specified path, try to find it in alternative locations
         alt_paths = [
@@ -43,7 +65,7 @@ def load_config(config_path: str = "config/config.yaml") -> Dict:
             try:
                 with open(path, "r") as file:
                     logger.info(f"Config loaded from alternative path: {path}")
-                    return yaml.safe_load(file)
+                    return yaml.load(file, Loader=SafeLoader)
             except FileNotFoundError:
                 continue
                 
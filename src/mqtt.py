@@ -1,7 +1,8 @@
+import functools
 import importlib
 import logging
 import threading
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Type
 
 from src.mqtt_config import MQTTConfig
 from src.mqtt_consumer import MQTTConsumer
@@ -9,16 +10,30 @@ from src.plugins.interface import Plugin
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_MQTT_FIELDS = frozenset(("broker", "consumer"))
+
 
 class MQTTConfigError(Exception):
     """Exception raised for errors in the MQTT configuration."""
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_plugin(name: str) -> Type[Plugin]:
+    """Import a plugin module once and return its plugin class."""
+    parts = name.split(".")
+    module_path = f"src.plugins.{'.'.join(parts)}"
+    module = importlib.import_module(module_path)
+    class_name = parts[-1].capitalize()
+    return getattr(module, class_name)
+
+
 class MQTT(threading.Thread):
     def __init__(self, config: Dict):
         super().__init__()
         self.config = config
         self.mqtt_consumers: List[MQTTConsumer] = []
+        self._plugin_cache: Dict[str, Plugin] = {}
+        self._topic_to_plugin: Dict[str, Optional[Plugin]] = {}
         self._stop_event = threading.Event()
         self._validate_and_initialize_config(config)
 
@@ -35,13 +50,7 @@ class MQTT(threading.Thread):
             mqtt_config = config["mqtt"]
 
             # Validate mqtt configuration
-            missing_fields = [
-                field for field in ["broker", "consumer"] if field not in mqtt_config
-            ]
-            if missing_fields:
-                raise MQTTConfigError(
-                    f"Missing required fields in mqtt config: {', '.join(missing_fields)}"
-                )
+            self._validate_base_config(mqtt_config)
 
             # Initialize with mqtt_config instead of config
             self._initialize_consumers(mqtt_config)
@@ -53,12 +62,10 @@ class MQTT(threading.Thread):
         if not isinstance(config, dict):
             raise MQTTConfigError("Configuration must be a dictionary")
 
-        missing_fields = [
-            field for field in ["broker", "consumer"] if field not in config
-        ]
+        missing_fields = REQUIRED_MQTT_FIELDS - config.keys()
         if missing_fields:
             raise MQTTConfigError(
-                f"Missing required fields: {', '.join(missing_fields)}"
+                f"Missing required fields in mqtt config: {', '.join(sorted(missing_fields))}"
             )
 
     def _validate_component_config(self, config: Dict, component: str) -> None:
@@ -75,52 +82,61 @@ class MQTT(threading.Thread):
     def _initialize_consumers(self, mqtt_config: Dict) -> None:
         """Initialize MQTT consumers."""
         self._validate_component_config(mqtt_config, "consumer")
-        mqtt_consumer_configs = [
-            self._create_consumer_config(mqtt_config, topic, i)
-            for i, topic in enumerate(mqtt_config["consumer"]["topics"])
+        topics = [
+            (topic.get("name", ""), topic.get("qos", 0))
+            for topic in mqtt_config["consumer"]["topics"]
         ]
 
-        self.mqtt_consumers = [MQTTConsumer(config) for config in mqtt_consumer_configs]
+        # A single client connection subscribes to every configured topic
+        self.mqtt_consumers = [
+            MQTTConsumer(self._create_consumer_config(mqtt_config), topics)
+        ]
 
         for consumer in self.mqtt_consumers:
             consumer.set_message_callback(self._on_message)
 
-    def _create_consumer_config(
-        self, mqtt_config: Dict, topic: Dict, index: int
-    ) -> MQTTConfig:
-        """Create configuration for a single consumer."""
+        # Resolve every configured topic to its plugin once, so the message
+        # path is a single dict lookup and never imports
+        for topic in mqtt_config["consumer"]["topics"]:
+            plugin_name = topic.get("plugin")
+            if plugin_name and plugin_name not in self._plugin_cache:
+                self._plugin_cache[plugin_name] = self.load_plugin(plugin_name)
+            self._topic_to_plugin[topic.get("name", "")] = (
+                self._plugin_cache[plugin_name] if plugin_name else None
+            )
+
+    def _create_consumer_config(self, mqtt_config: Dict) -> MQTTConfig:
+        """Create the connection configuration shared by all topics."""
+        # Optional client tuning keys override the MQTTConfig defaults
+        tuning = {
+            key: mqtt_config[key]
+            for key in (
+                "max_inflight",
+                "max_queued",
+                "reconnect_min_delay",
+                "reconnect_max_delay",
+            )
+            if key in mqtt_config
+        }
         return MQTTConfig(
             broker=mqtt_config["broker"],
             port=mqtt_config.get("port", 1883),
-            topic=topic.get("name", ""),
-            qos=topic.get("qos", 0),
-            plugin=topic.get("plugin", "default"),
-            client_id=f"{mqtt_config['consumer']['client_id']}_{index}",
+            client_id=mqtt_config["consumer"]["client_id"],
+            **tuning,
         )
 
     def load_plugin(self, name: str) -> Plugin:
         """Load a plugin module."""
-        parts = name.split(".")
-        module_path = f"src.plugins.{'.'.join(parts)}"
-        module = importlib.import_module(module_path)
-        class_name = parts[-1].capitalize()
-        return getattr(module, class_name)()
+        return _resolve_plugin(name)()
 
-    def _on_message(self, topic: str, payload: bytes, userdata: Any) -> None:
+    def _on_message(self, topic: str, payload: memoryview, userdata: Any) -> None:
         """Handle incoming MQTT messages."""
-        topics = self.config.get("mqtt", {}).get("consumer", {}).get("topics", [])
-        # Find the matching topic configuration
-        topic_conf = next((item for item in topics if item.get("name") == topic), None)
-        if topic_conf:
-            plugin_name = topic_conf.get("plugin")
-            if plugin_name:
-                plugin_instance = self.load_plugin(plugin_name)
-                plugin_instance.input(topic, payload, userdata)
-                logger.info(f"Plugin {plugin_name} called for topic: {topic}")
-            else:
-                logger.info(f"No plugin configured for topic: {topic}")
-        else:
-            logger.info(f"No configuration found for topic: {topic}")
+        plugin_instance = self._topic_to_plugin.get(topic)
+        if plugin_instance is not None:
+            plugin_instance.input(topic, payload, userdata)
+        elif logger.isEnabledFor(logging.DEBUG):
+            # Unrouted topics can be high rate, so they are only reported at DEBUG
+            logger.debug(f"No plugin configured for topic: {topic}")
 
     def run(self) -> None:
         """Run the MQTT thread."""
@@ -139,6 +155,14 @@ class MQTT(threading.Thread):
         for consumer in self.mqtt_consumers:
             consumer.stop()
 
+        # Consumers have drained their queues, so plugins can flush whatever
+        # their output tools still buffer
+        for name, plugin in self._plugin_cache.items():
+            try:
+                plugin.close()
+            except Exception as e:
+                logger.error(f"Failed to close plugin {name}: {e}")
+
     def stop(self) -> None:
         """Signal the thread to stop."""
         self._stop_event.set()
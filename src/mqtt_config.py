@@ -6,9 +6,11 @@ from pydantic import BaseModel
 class MQTTConfig(BaseModel):
     broker: str
     port: int = 1883
-    topic: str
     qos: int = 0
     username: Optional[str] = None
     password: Optional[str] = None
     client_id: str = "mqtt_client"
-    plugin: str
+    max_inflight: int = 1000
+    max_queued: int = 0
+    reconnect_min_delay: int = 1
+    reconnect_max_delay: int = 8
@@ -1,6 +1,12 @@
 import paho.mqtt.client as mqtt
-from typing import Optional, Callable, Any
+from paho.mqtt.properties import Properties
+from paho.mqtt.reasoncodes import ReasonCode
+from paho.mqtt.subscribeoptions import SubscribeOptions
+from typing import Optional, Callable, Any, List, Tuple
 import logging
+import queue
+import socket
+import threading
 import time
 from src.mqtt_config import MQTTConfig
 
@@ -8,34 +14,95 @@ logger = logging.getLogger(__name__)
 
 
 class MQTTConsumer:
-    def __init__(self, config: MQTTConfig):
+    """Consumer subscribing to one or more topics over a single client connection"""
+
+    def __init__(
+        self, config: MQTTConfig, topics: List[Tuple[str, int]], userdata: Any = None
+    ):
         self.config = config
-        self.client = mqtt.Client(client_id=config.client_id)
-        self.message_callback: Optional[Callable[[str, bytes, Any], None]] = None
+        self.topics = topics
+        # Passed to the message callback with every message
+        self.userdata = userdata
+        self.client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2,
+            client_id=config.client_id,
+            protocol=mqtt.MQTTv5,
+        )
+        self.message_callback: Optional[Callable[[str, memoryview, Any], None]] = None
+
+        # Messages are handed from paho's network thread to a worker thread, so
+        # slow plugins only block socket reads once the queue has filled up
+        self._queue: queue.Queue = queue.Queue(maxsize=8192)
+        self._worker = threading.Thread(
+            target=self._message_worker,
+            daemon=True,
+            name=f"mqtt-consumer-{config.client_id}",
+        )
 
         if config.username and config.password:
             self.client.username_pw_set(config.username, config.password)
 
+        # The consumer is paho's userdata, so the message callback can be a
+        # plain function instead of a bound method looked up per message. The
+        # caller's own userdata is kept in self.userdata and handed on from there
+        self.client.user_data_set(self)
         self.client.on_connect = self._on_connect
-        self.client.on_message = self._on_message
+        self.client.on_message = MQTTConsumer._on_message
+        self.client.on_socket_open = self._on_socket_open
 
     def _on_connect(
-        self, client: mqtt.Client, userdata: Any, flags: dict, rc: int
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        flags: mqtt.ConnectFlags,
+        reason_code: ReasonCode,
+        properties: Optional[Properties],
     ) -> None:
-        if rc == 0:
+        if not reason_code.is_failure:
             logger.info(f"Connected to MQTT broker {self.config.broker}")
-            logger.info(f"Subscribing to topic: {self.config.topic}")
-            self.client.subscribe(self.config.topic, self.config.qos)
+            logger.info(
+                f"Subscribing to topics: {', '.join(topic for topic, _ in self.topics)}"
+            )
+            # One SUBSCRIBE packet carries every topic filter
+            self.client.subscribe(
+                [(topic, SubscribeOptions(qos=qos)) for topic, qos in self.topics]
+            )
         else:
-            logger.error(f"Failed to connect to MQTT broker with code: {rc}")
+            logger.error(f"Failed to connect to MQTT broker: {reason_code}")
+
+    def _on_socket_open(
+        self, client: mqtt.Client, userdata: Any, sock: socket.socket
+    ) -> None:
+        # Disable Nagle so acknowledgements are not held back waiting to coalesce
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as e:
+            logger.warning(f"Failed to set TCP_NODELAY on MQTT socket: {e}")
 
+    @staticmethod
     def _on_message(
-        self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage
+        client: mqtt.Client, consumer: "MQTTConsumer", msg: mqtt.MQTTMessage
     ) -> None:
-        if self.message_callback:
-            self.message_callback(msg.topic, msg.payload, userdata)
+        # memoryview lets plugins slice the payload without copying it. When
+        # the queue is full this blocks paho's network thread, which stops
+        # reading the socket and pushes back on the broker instead of dropping
+        consumer._queue.put((msg.topic, memoryview(msg.payload), consumer.userdata))
 
-    def set_message_callback(self, callback: Callable[[str, bytes, Any], None]) -> None:
+    def _message_worker(self) -> None:
+        """Invoke the message callback for queued messages until stopped"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.message_callback:
+                try:
+                    self.message_callback(*item)
+                except Exception:
+                    logger.exception(f"Message callback failed for topic {item[0]}")
+
+    def set_message_callback(
+        self, callback: Callable[[str, memoryview, Any], None]
+    ) -> None:
         """Set callback function to handle incoming messages"""
         self.message_callback = callback
 
@@ -44,6 +111,14 @@ class MQTTConsumer:
         max_retries = 5
         retry_delay = 2  # seconds
 
+        # The paho default of 20 in-flight messages stalls QoS>=1 throughput
+        self.client.max_inflight_messages_set(self.config.max_inflight)
+        self.client.max_queued_messages_set(self.config.max_queued)
+        self.client.reconnect_delay_set(
+            min_delay=self.config.reconnect_min_delay,
+            max_delay=self.config.reconnect_max_delay,
+        )
+
         for attempt in range(1, max_retries + 1):
             try:
                 logger.info(
@@ -70,9 +145,15 @@ class MQTTConsumer:
 
     def start(self) -> None:
         """Start the MQTT client loop"""
+        self._worker.start()
         self.client.loop_start()
 
     def stop(self) -> None:
         """Stop the MQTT client loop"""
         self.client.loop_stop()
         self.client.disconnect()
+        if self._worker.is_alive():
+            # Sentinel lets the worker finish queued messages before exiting
+            self._queue.put(None)
+            self._worker.join()
+
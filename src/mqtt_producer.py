@@ -1,14 +1,21 @@
 from typing import Any, Optional
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.properties import Properties
+from paho.mqtt.reasoncodes import ReasonCode
 
 from src.mqtt_config import MQTTConfig
 
 
 class MQTTProducer:
-    def __init__(self, config: MQTTConfig):
+    def __init__(self, config: MQTTConfig, topic: str = ""):
         self.config = config
-        self.client = mqtt.Client(client_id=config.client_id)
+        self.topic = topic
+        self.client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2,
+            client_id=config.client_id,
+            protocol=mqtt.MQTTv5,
+        )
 
         if config.username and config.password:
             self.client.username_pw_set(config.username, config.password)
@@ -16,12 +23,17 @@ class MQTTProducer:
         self.client.on_connect = self._on_connect
 
     def _on_connect(
-        self, client: mqtt.Client, userdata: Any, flags: dict, rc: int
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        flags: mqtt.ConnectFlags,
+        reason_code: ReasonCode,
+        properties: Optional[Properties],
     ) -> None:
-        if rc == 0:
+        if not reason_code.is_failure:
             print(f"Connected to MQTT broker {self.config.broker} as Producer")
         else:
-            print(f"Failed to connect to MQTT broker with code: {rc}")
+            print(f"Failed to connect to MQTT broker: {reason_code}")
 
     def connect(self) -> None:
         """Connect to MQTT broker"""
@@ -45,9 +57,9 @@ class MQTTProducer:
     ) -> None:
         """
         Publish a message to a topic.
-        If topic is None, uses the default topic from configuration.
+        If topic is None, uses the default topic given to the constructor.
         If qos is None, uses the default qos from configuration.
         """
-        topic_to_use = topic if topic is not None else self.config.topic
+        topic_to_use = topic if topic is not None else self.topic
         qos_to_use = qos if qos is not None else self.config.qos
         self.client.publish(topic_to_use, payload, qos=qos_to_use, retain=retain)
@@ -1,34 +1,138 @@
+import functools
 import importlib
 import logging
 import os
-from typing import Any
+import threading
+from typing import Any, ClassVar, Dict, Optional, Type, Union
 
 import yaml
 
-from src.plugins.aissens.packet_processor import (
-    BytesExtractInput,
-    HexToNumberInput,
-    PacketProcessor,
-)
-from src.plugins.aissens.packet_fft import PacketFFTDecoder
-from src.plugins.aissens.packet_oa_only import (
-    PacketOADecoder,
-)
+from src.plugins.aissens.packet_common import PacketDecodeError
 from src.plugins.interface import Plugin
+from src.tools.sqlite.sqlite import Sqlite
+from src.tools.stdout.stdout import Stdout
 from src.tools.tools_interface import OutputInterface
 
+try:
+    # libyaml-backed loader, same semantics as yaml.safe_load
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-pp = PacketProcessor()
+
+@functools.cache
+def _fft_decoder() -> type:
+    """Import the FFT decoder (and numpy) when the first FFT packet arrives."""
+    from src.plugins.aissens.packet_fft import PacketFFTDecoder
+
+    return PacketFFTDecoder
+
+
+@functools.cache
+def _oa_decoder() -> type:
+    """Import the OA decoder when the first OA packet arrives."""
+    from src.plugins.aissens.packet_oa_only import PacketOADecoder
+
+    return PacketOADecoder
+
+
+# Packet kind and decoder loader for each supported data type
+# (1: FFT data, 6: Real time FFT, 71/72: Raw data + FFT,
+#  9: OA only, 10: Real time OA only)
+_DECODERS = {
+    1: ("FFT", _fft_decoder),
+    6: ("FFT", _fft_decoder),
+    71: ("FFT", _fft_decoder),
+    72: ("FFT", _fft_decoder),
+    9: ("OA", _oa_decoder),
+    10: ("OA", _oa_decoder),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> dict:
+    """
+    Load configuration from config/config.yaml or fallback to config/config_example.yaml.
+
+    The configuration is static for the lifetime of the process, so it is
+    parsed once and shared by every Packet instance.
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    config_dir = os.path.join(current_dir, "config")
+    config_path = os.path.join(config_dir, "config.yaml")
+    example_config_path = os.path.join(config_dir, "config_example.yaml")
+
+    try:
+        if os.path.exists(config_path):
+            with open(config_path, "r") as f:
+                logger.info("Loaded configuration from config/config.yaml")
+                return yaml.load(f, Loader=SafeLoader)
+        else:
+            logger.warning(
+                "config/config.yaml not found, using config/config_example.yaml"
+            )
+            with open(example_config_path, "r") as f:
+                logger.info("Loaded configuration from config/config_example.yaml")
+                return yaml.load(f, Loader=SafeLoader)
+    except Exception as e:
+        logger.error(f"Failed to load config: {str(e)}")
+        return {"output": {"name": "vibration_data"}}
+
+
+# Built-in tools without optional dependencies are resolved statically; other
+# tool paths (e.g. tools.adx.adx) are imported on demand by _resolve_tool
+_TOOL_REGISTRY: Dict[str, Type[OutputInterface]] = {
+    "tools.sqlite.sqlite": Sqlite,
+    "tools.stdout.stdout": Stdout,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_tool(tool_path: str) -> Type[OutputInterface]:
+    """
+    Import an output tool module once and return its class.
+
+    Args:
+        tool_path (str): Dot-separated path to tool module (e.g. "tools.stdout.stdout")
+
+    Returns:
+        Type[OutputInterface]: The tool class
+    """
+    # Import the module
+    module_path = f"src.{tool_path}"
+    module = importlib.import_module(module_path)
+
+    # Get the class name from the last part of the path and capitalize it
+    class_name = tool_path.split(".")[-1].capitalize()
+    class_obj = getattr(module, class_name)
+
+    # Validate it implements the OutputInterface
+    if not issubclass(class_obj, OutputInterface):
+        raise ValueError(f"Class {class_obj.__name__} must implement OutputInterface")
+
+    return class_obj
 
 
 class Packet(Plugin):
+    # One data saver (and so one database connection) is shared by every
+    # Packet instance; it is created by the first instance
+    _data_saver: ClassVar[Optional[OutputInterface]] = None
+    _data_saver_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
-        config = self._load_config()
+        config = _load_config()
         self.output_name = config.get("output", {}).get("name", "data")
         tool_path = config.get("tool", "tools.sqlite.sqlite")
-        self.data_saver = self._create_data_saver(tool_path)
+        with Packet._data_saver_lock:
+            if Packet._data_saver is None:
+                Packet._data_saver = self._create_data_saver(tool_path)
+        self.data_saver = Packet._data_saver
+        # One decoder per packet kind, created on first use and reused for
+        # every later message of that kind
+        self._decoders: Dict[str, Any] = {}
         logger.info(f"Using output name: {self.output_name}")
 
     def _create_data_saver(self, tool_path: str) -> OutputInterface:
@@ -42,129 +146,81 @@ class Packet(Plugin):
             OutputInterface: Configured data saver instance
         """
         try:
-            # Import the module
-            module_path = f"src.{tool_path}"
-            module = importlib.import_module(module_path)
-
-            # Get the class name from the last part of the path and capitalize it
-            class_name = tool_path.split(".")[-1].capitalize()
-            class_obj = getattr(module, class_name)
-
-            # Validate it implements the OutputInterface
-            if not issubclass(class_obj, OutputInterface):
-                raise ValueError(
-                    f"Class {class_obj.__name__} must implement OutputInterface"
-                )
+            tool_class = _TOOL_REGISTRY.get(tool_path) or _resolve_tool(tool_path)
 
             # Create and return the instance
-            return class_obj()
+            return tool_class()
 
         except Exception as e:
             logger.error(f"Failed to create data saver: {str(e)}")
             logger.warning("Falling back to Sqlite")
-            from src.tools.sqlite.sqlite import Sqlite
-
             return Sqlite()
 
-    def _load_config(self) -> dict:
-        """Load configuration from config/config.yaml or fallback to config/config_example.yaml"""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        config_dir = os.path.join(current_dir, "config")
-        config_path = os.path.join(config_dir, "config.yaml")
-        example_config_path = os.path.join(config_dir, "config_example.yaml")
-
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    logger.info("Loaded configuration from config/config.yaml")
-                    return yaml.safe_load(f)
-            else:
-                logger.warning(
-                    "config/config.yaml not found, using config/config_example.yaml"
-                )
-                with open(example_config_path, "r") as f:
-                    logger.info("Loaded configuration from config/config_example.yaml")
-                    return yaml.safe_load(f)
-        except Exception as e:
-            logger.error(f"Failed to load config: {str(e)}")
-            return {"output": {"name": "vibration_data"}}
-
-    def input(self, topic: str, payload: bytes, userdata: Any) -> None:
-        logger.debug(
-            f"Received message on topic {topic}, payload: {payload.hex()[:10]}..."
-        )
+    def input(
+        self, topic: str, payload: Union[bytes, memoryview], userdata: Any
+    ) -> None:
+        # Decoders slice the payload; on a memoryview those slices are views,
+        # not copies. The MQTT consumer already passes one, other callers may not
+        payload = memoryview(payload)
+
+        if not payload:
+            logger.error(f"Failed to process packet: empty payload on topic {topic}")
+            return
+
+        # The data type is the first byte of the packet
+        data_type = payload[0]
+        entry = _DECODERS.get(data_type)
+
+        # Handle not supported data types
+        if entry is None:
+            logger.warning(
+                f"Received unsupported data type {data_type} on topic {topic}"
+            )
+            return
 
+        kind, load_decoder = entry
+        decoder = self._decoders.get(kind)
+        if decoder is None:
+            decoder = self._decoders[kind] = load_decoder()()
         try:
-            # Extract the data type from the packet
-            extract_input = BytesExtractInput(data=payload, offset=0, length=1)
-            data_type_hex = pp.extract_hex(extract_input)
-            number_input = HexToNumberInput(
-                hex_str=data_type_hex, data_type="int", endian="little"
+            decoder.decode(payload)
+        except PacketDecodeError as e:
+            logger.error(f"Failed to decode {kind} packet on topic {topic}: {str(e)}")
+            return
+
+        sensor_name = self._get_sensor_name(topic)
+        # One debug record per decoded message instead of one per step
+        if logger.isEnabledFor(logging.DEBUG):
+            packet = decoder.packet
+            logger.debug(
+                f"Received {packet.data_type_name} packet (data type {data_type}) "
+                f"from sensor {sensor_name} on topic {topic}, timestamp "
+                f"{packet.timestamp.isoformat()}, payload: {payload[:5].hex()}..."
             )
-            data_type = pp.hex_to_number(number_input)
-            logger.debug(f"The received message data type: {data_type}")
-
-            # FFT related packets (1: FFT data, 6: Real time FFT, 71/72: Raw data + FFT)
-            if data_type in [1, 6, 71, 72]:
-                logger.debug(f"Received FFT data packet on topic {topic}")
-                try:
-                    decoder = PacketFFTDecoder(payload)
-                    decoder.decode()
-                    sensor_name = self._get_sensor_name(topic)
-                    if decoder.fft_packet:
-                        self._output(
-                            self.output_name,
-                            {
-                                "timestamp": decoder.fft_packet.timestamp.isoformat(),
-                                "sensor_name": sensor_name,
-                                "data_type": data_type,
-                                "json_value": decoder.to_json(),
-                            },
-                        )
-                    else:
-                        raise Exception("")
-                except Exception as e:
-                    logger.error(f"Failed to decode FFT packet: {str(e)}")
-
-            # OA related packets (9: OA only, 10: Real time OA only)
-            elif data_type in [9, 10]:
-                logger.debug(f"Received OA data packet on topic {topic}")
-                try:
-                    decoder = PacketOADecoder(payload)
-                    decoder.decode()
-                    sensor_name = self._get_sensor_name(topic)
-                    if decoder.oa_packet:
-                        self._output(
-                            self.output_name,
-                            {
-                                "timestamp": decoder.oa_packet.timestamp.isoformat(),
-                                "sensor_name": sensor_name,
-                                "data_type": data_type,
-                                "json_value": decoder.to_json(),
-                            },
-                        )
-                    else:
-                        raise Exception("")
-                except Exception as e:
-                    logger.error(f"Failed to decode OA packet: {str(e)}")
-
-            # Handle not supported data types
-            else:
-                logger.warning(
-                    f"Received unsupported data type {data_type} on topic {topic}"
-                )
 
-        except Exception as e:
-            logger.error(f"Failed to process packet: {str(e)}")
+        record = decoder.to_output_record(sensor_name)
+        self._output(self.output_name, record)
 
     def _output(self, name: str, data: dict) -> None:
         # Save the data to the database
         try:
             # Log truncated data for debugging - safely convert dict to string for logging
-            logger.debug(f"Writing data to {name}: {str(data)[:100]}{'...' if len(str(data)) > 100 else ''}")
+            if logger.isEnabledFor(logging.DEBUG):
+                text = str(data)
+                logger.debug(
+                    f"Writing data to {name}: {text[:100]}{'...' if len(text) > 100 else ''}"
+                )
             self.data_saver.output(name, **data)
         except Exception as e:
             logger.error(f"Failed to save data to the database: {str(e)}")
 
+    def close(self) -> None:
+        # The data saver is shared, so the first instance closed flushes and
+        # closes it for all of them
+        with Packet._data_saver_lock:
+            if Packet._data_saver is not None:
+                Packet._data_saver.close()
+                Packet._data_saver = None
+
     def _get_sensor_name(self, topic: str) -> str:
-        return topic.split("/")[0]
+        return topic.partition("/")[0]
@@ -1,4 +1,10 @@
-from typing import Literal
+import json
+from typing import Literal, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DataTypeName = Literal[
     "Raw data",
@@ -32,3 +38,44 @@ DATA_TYPE_MAP = {
     10: "Real time OA only",
     11: "Ask command",
 }
+
+# DATA_TYPE_MAP expanded to every byte value, so a data type name is a tuple
+# index instead of a dict lookup with a default
+DATA_TYPE_NAMES: tuple[DataTypeName, ...] = tuple(
+    cast(DataTypeName, DATA_TYPE_MAP.get(i, "Reserved")) for i in range(256)
+)
+
+
+class PacketDecodeError(Exception):
+    """Base class for errors raised by the packet decoders."""
+
+
+def _json_default(obj):
+    """Serialize numpy arrays and scalars for the standard library json module."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data: dict) -> str:
+    """
+    Serialize a decoded packet to a compact JSON string.
+
+    Numpy arrays may be passed as values directly. Uses orjson when it is
+    installed, which writes them straight from the array buffer, and falls
+    back to the standard library json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data, separators=(",", ":"), default=_json_default)
+
+
+def dumps_json_bytes(data: dict) -> bytes:
+    """
+    Serialize a decoded packet to compact UTF-8 encoded JSON.
+
+    Same output as dumps_json, without decoding the orjson result to str.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return dumps_json(data).encode()
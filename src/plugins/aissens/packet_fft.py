@@ -1,26 +1,86 @@
-import json
-from dataclasses import dataclass
+import functools
+import struct
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import cast
+from typing import Callable, Iterable, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from src.plugins.aissens.packet_processor import (
-    BytesExtractInput,
-    HexToNumberInput,
-    HexToTimestampInput,
-    PacketProcessor,
-)
+# Opt-in: scipy is not a declared dependency, since it is a large install for
+# one multi-threaded FFT. Install it alongside the package to enable it
+try:
+    import scipy.fft as sfft
+except ImportError:
+    sfft = None
+
+from src.plugins.aissens.packet_processor import PacketProcessor
 from src.plugins.aissens.packet_common import (
-    DATA_TYPE_MAP,
+    DATA_TYPE_NAMES,
     DataTypeName,
+    PacketDecodeError,
+    dumps_json,
+    dumps_json_bytes,
 )
 
-pp = PacketProcessor()
+
+# Fixed 50 byte header preceding the acceleration/velocity blocks. Field
+# endianness differs per field as sent by the sensor, so the header is read
+# with three precompiled structs: big-endian counters and readings, the
+# little-endian float readings, then the big-endian lengths and reserved bytes.
+HEADER_READINGS = struct.Struct(">biQbbhhh")
+HEADER_FLOATS = struct.Struct("<ffff")
+HEADER_LENGTHS = struct.Struct(">ii5s")
+
+
+@functools.lru_cache(maxsize=8)
+def signal_reader(
+    report_len: int, fft_length: int
+) -> Callable[[Union[bytes, memoryview]], np.ndarray]:
+    """
+    Build a reader for the sample blocks of one (report_len, fft_length) shape.
+
+    Sensors send a fixed shape per firmware configuration, so the counts and
+    slices are computed once per shape and the reader is cached.
+
+    Returns:
+        Callable: Function reading a packet into a zero-padded (6, fft_length)
+            array holding acc x/y/z and vec x/y/z as rows
+    """
+    if report_len < 0 or fft_length < report_len:
+        raise ValueError(
+            f"Invalid report_len {report_len} for fft_length {fft_length}"
+        )
+
+    count = 6 * report_len
+    shape = (6, report_len)
+    padded_shape = (6, fft_length)
+    samples = np.s_[:, :report_len]
+
+    def read(file_bytes: Union[bytes, memoryview]) -> np.ndarray:
+        # The six little-endian float32 blocks (acc x/y/z, then vec x/y/z)
+        # follow the header back to back, so they are read in one call
+        values = np.frombuffer(file_bytes, dtype="<f4", count=count, offset=50)
+        # Samples stay float32 as sent, so the FFT runs in complex64
+        signals = np.zeros(padded_shape, dtype=np.float32)
+        signals[samples] = values.reshape(shape)
+        return signals
+
+    return read
 
 
-@dataclass
+def rfft_rows(signals: np.ndarray) -> np.ndarray:
+    """
+    Real FFT of every row of a 2-D array.
+
+    Uses scipy.fft with all available workers when scipy has been installed
+    (it is optional and not in pyproject) and numpy.fft otherwise.
+    """
+    if sfft is not None:
+        return sfft.rfft(signals, axis=1, workers=-1)
+    return np.fft.rfft(signals, axis=1)
+
+
+@dataclass(slots=True, frozen=True)
 class PacketFFT:
     """
     Data class representing an FFT packet with sensor data.
@@ -60,7 +120,12 @@ class PacketFFT:
         vec_x_padded (np.ndarray): Zero-padded velocity values for X axis
         vec_y_padded (np.ndarray): Zero-padded velocity values for Y axis
         vec_z_padded (np.ndarray): Zero-padded velocity values for Z axis
+        signals (np.ndarray): Zero-padded (6, fft_length) float32 array holding
+            acc x/y/z and vec x/y/z as rows; the per-axis values and padded
+            arrays are properties returning views into it
         freqs (np.ndarray): Frequency values for FFT
+        fft_acc (np.ndarray): Real FFT of acc x/y/z as rows, computed on first use
+        fft_vec (np.ndarray): Real FFT of vec x/y/z as rows, computed on first use
     """
 
     # Data type
@@ -97,24 +162,81 @@ class PacketFFT:
     fft_length: int
     report_len: int
     reserved_bytes: bytes
-    _acc_x_values: np.ndarray
-    _acc_y_values: np.ndarray
-    _acc_z_values: np.ndarray
-    _vec_x_values: np.ndarray
-    _vec_y_values: np.ndarray
-    _vec_z_values: np.ndarray
-    acc_x_padded: np.ndarray
-    acc_y_padded: np.ndarray
-    acc_z_padded: np.ndarray
-    vec_x_padded: np.ndarray
-    vec_y_padded: np.ndarray
-    vec_z_padded: np.ndarray
+    signals: np.ndarray
     velocity_data: dict[str, np.ndarray]
     acceleration_data: dict[str, np.ndarray]
     freqs: np.ndarray
+    # Spectra of all six rows of signals, filled in by the first fft_acc or
+    # fft_vec access
+    _spectra: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _spectrum(self) -> np.ndarray:
+        if self._spectra is None:
+            # The packet is frozen, but the spectra are derived from signals
+            # and computing them once per packet does not change its value
+            object.__setattr__(self, "_spectra", rfft_rows(self.signals))
+        return self._spectra
+
+    @property
+    def _acc_x_values(self) -> np.ndarray:
+        return self.acceleration_data["x"]
+
+    @property
+    def _acc_y_values(self) -> np.ndarray:
+        return self.acceleration_data["y"]
+
+    @property
+    def _acc_z_values(self) -> np.ndarray:
+        return self.acceleration_data["z"]
+
+    @property
+    def _vec_x_values(self) -> np.ndarray:
+        return self.velocity_data["x"]
+
+    @property
+    def _vec_y_values(self) -> np.ndarray:
+        return self.velocity_data["y"]
+
+    @property
+    def _vec_z_values(self) -> np.ndarray:
+        return self.velocity_data["z"]
 
+    @property
+    def acc_x_padded(self) -> np.ndarray:
+        return self.signals[0]
 
-class FFTDecodeError(Exception):
+    @property
+    def acc_y_padded(self) -> np.ndarray:
+        return self.signals[1]
+
+    @property
+    def acc_z_padded(self) -> np.ndarray:
+        return self.signals[2]
+
+    @property
+    def vec_x_padded(self) -> np.ndarray:
+        return self.signals[3]
+
+    @property
+    def vec_y_padded(self) -> np.ndarray:
+        return self.signals[4]
+
+    @property
+    def vec_z_padded(self) -> np.ndarray:
+        return self.signals[5]
+
+    @property
+    def fft_acc(self) -> np.ndarray:
+        return self._spectrum()[:3]
+
+    @property
+    def fft_vec(self) -> np.ndarray:
+        return self._spectrum()[3:]
+
+
+class FFTDecodeError(PacketDecodeError):
     def __init__(self, field_name: str, error: Exception):
         self.field_name = field_name
         self.error = error
@@ -122,236 +244,100 @@ class FFTDecodeError(Exception):
 
 
 class PacketFFTDecoder:
-    def __init__(self, file_bytes: bytes):
+    __slots__ = ("file_bytes", "fft_packet", "_fig", "_axs", "_lines")
+
+    def __init__(self, file_bytes: Union[bytes, memoryview, None] = None):
         """
         Initialize the FFT packet decoder.
 
         Args:
-            file_bytes (bytes): Raw binary data to be decoded
+            file_bytes (bytes | memoryview, optional): Raw binary data to be
+                decoded; may instead be passed to decode(), so one decoder can
+                be reused for a stream of packets
         """
-        self.file_bytes = file_bytes
+        # Slices of a memoryview are zero-copy views into the payload
+        self.file_bytes = None if file_bytes is None else memoryview(file_bytes)
         self.fft_packet: PacketFFT | None = None
+        # Figure reused by repeated plot() calls
+        self._fig = None
+        self._axs = None
+        self._lines = None
+
+    @property
+    def packet(self) -> PacketFFT | None:
+        """The decoded packet, or None before decode() has run."""
+        return self.fft_packet
 
-    def decode(self) -> PacketFFT:
+    def decode(
+        self, file_bytes: Union[bytes, memoryview, None] = None
+    ) -> PacketFFT:
         """
         Decode the binary data into a structured FFT packet.
         Raises FFTDecodeError with specific field information on failure.
+
+        Args:
+            file_bytes (bytes | memoryview, optional): Packet to decode in
+                place of the one given to the constructor
         """
-        try:
-            data_type_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=0, length=1)
-            )
-            data_type = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=data_type_hex, data_type="int", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("data_type", e)
+        if file_bytes is not None:
+            self.file_bytes = memoryview(file_bytes)
+        if self.file_bytes is None:
+            raise ValueError("No FFT packet data to decode.")
+        self.fft_packet = None
 
         try:
-            data_type_name = cast(
-                DataTypeName, DATA_TYPE_MAP.get(data_type, "Reserved")
-            )
-        except Exception as e:
-            raise FFTDecodeError("data_type_name", e)
+            (
+                data_type,
+                data_length,
+                raw_timestamp,
+                fft_result,
+                battery_level,
+                raw_adcavg,
+                raw_adclast,
+                raw_temperature,
+            ) = HEADER_READINGS.unpack_from(self.file_bytes, 0)
+            oa_x, oa_y, oa_z, freq_resolution = HEADER_FLOATS.unpack_from(
+                self.file_bytes, 21
+            )
+            fft_length, report_len, reserved_bytes = HEADER_LENGTHS.unpack_from(
+                self.file_bytes, 37
+            )
+        except struct.error as e:
+            raise FFTDecodeError("header", e)
+
+        # data_type is unpacked signed; masking maps negative values onto the
+        # reserved range 128..255
+        data_type_name = DATA_TYPE_NAMES[data_type & 0xFF]
 
         try:
-            data_length_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=1, length=4)
-            )
-            data_length = pp.hex_to_number(
-                HexToNumberInput(hex_str=data_length_hex, data_type="int", endian="big")
-            )
-        except Exception as e:
-            raise FFTDecodeError("data_length", e)
-
-        try:
-            timestamp_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=5, length=8)
-            )
-            timestamp = pp.hex_to_timestamp(
-                HexToTimestampInput(hex_str=timestamp_hex, endian="big")
-            )
+            timestamp = PacketProcessor.raw_to_timestamp(raw_timestamp)
         except Exception as e:
             raise FFTDecodeError("timestamp", e)
 
-        try:
-            fft_result_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=13, length=1)
-            )
-            fft_result = pp.hex_to_number(
-                HexToNumberInput(
-                    hex_str=fft_result_hex, data_type="int", endian="little"
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("fft_result", e)
-
-        try:
-            battery_level_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=14, length=1)
-            )
-            battery_level = pp.hex_to_number(
-                HexToNumberInput(
-                    hex_str=battery_level_hex, data_type="int", endian="little"
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("battery_level", e)
-
-        try:
-            adcavg_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=15, length=2)
-            )
-            adcavg = pp.hex_to_adc(
-                HexToNumberInput(hex_str=adcavg_hex, data_type="int", endian="big")
-            )
-        except Exception as e:
-            raise FFTDecodeError("adcavg", e)
-
-        try:
-            adclast_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=17, length=2)
-            )
-            adclast = pp.hex_to_adc(
-                HexToNumberInput(hex_str=adclast_hex, data_type="int", endian="big")
-            )
-        except Exception as e:
-            raise FFTDecodeError("adclast", e)
-
-        try:
-            temperature_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=19, length=2)
-            )
-            temperature = pp.hex_to_temperature(
-                HexToNumberInput(
-                    hex_str=temperature_hex, data_type="int", endian="big"
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("temperature", e)
-
-        try:
-            oa_x_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=21, length=4)
-            )
-            oa_x = pp.hex_to_number(
-                HexToNumberInput(hex_str=oa_x_hex, data_type="float", endian="little")
-            )
-        except Exception as e:
-            raise FFTDecodeError("oa_x", e)
-
-        try:
-            oa_y_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=25, length=4)
-            )
-            oa_y = pp.hex_to_number(
-                HexToNumberInput(hex_str=oa_y_hex, data_type="float", endian="little")
-            )
-        except Exception as e:
-            raise FFTDecodeError("oa_y", e)
-
-        try:
-            oa_z_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=29, length=4)
-            )
-            oa_z = pp.hex_to_number(
-                HexToNumberInput(hex_str=oa_z_hex, data_type="float", endian="little")
-            )
-        except Exception as e:
-            raise FFTDecodeError("oa_z", e)
-
-        try:
-            freq_resolution_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=33, length=4)
-            )
-            freq_resolution = pp.hex_to_number(
-                HexToNumberInput(
-                    hex_str=freq_resolution_hex, data_type="float", endian="little"
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("freq_resolution", e)
-
-        try:
-            fft_length_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=37, length=4)
-            )
-            fft_length = pp.hex_to_number(
-                HexToNumberInput(hex_str=fft_length_hex, data_type="int", endian="big")
-            )
-        except Exception as e:
-            raise FFTDecodeError("fft_length", e)
+        adcavg = PacketProcessor.raw_to_adc(raw_adcavg)
+        adclast = PacketProcessor.raw_to_adc(raw_adclast)
+        temperature = PacketProcessor.raw_to_temperature(raw_temperature)
 
         try:
-            report_len_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=41, length=4)
-            )
-            report_len = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=report_len_hex, data_type="int", endian="big"
-                    )
-                )
-            )
-        except Exception as e:
-            raise FFTDecodeError("report_len", e)
+            read_signals = signal_reader(report_len, fft_length)
+        except ValueError as e:
+            raise FFTDecodeError("padding", e)
 
         try:
-            reserved_bytes_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=45, length=5)
-            )
-            reserved_bytes = bytes.fromhex(reserved_bytes_hex)
+            # All six axes live zero-padded in one contiguous (6, fft_length)
+            # array; the per-axis arrays below are views into it
+            signals = read_signals(self.file_bytes)
         except Exception as e:
-            raise FFTDecodeError("reserved_bytes", e)
+            raise FFTDecodeError("report_values", e)
 
-        try:
-            acc_x_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = 50 + i * 4
-                acc_x_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                acc_x_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=acc_x_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("acc_x_values", e)
-
-        try:
-            acc_y_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = int(50 + report_len * 4 + i * 4)
-                acc_y_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                acc_y_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=acc_y_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("acc_y_values", e)
-
-        try:
-            acc_z_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = int(50 + 2 * report_len * 4 + i * 4)
-                acc_z_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                acc_z_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=acc_z_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("acc_z_values", e)
+        (
+            acc_x_values,
+            acc_y_values,
+            acc_z_values,
+            vec_x_values,
+            vec_y_values,
+            vec_z_values,
+        ) = signals[:, :report_len]
 
         acceleration_data = {
             "x": acc_x_values,
@@ -359,99 +345,16 @@ class PacketFFTDecoder:
             "z": acc_z_values,
         }
 
-        try:
-            vec_x_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = int(50 + 3 * report_len * 4 + i * 4)
-                vec_x_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                vec_x_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=vec_x_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("vec_x_values", e)
-
-        try:
-            vec_y_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = int(50 + 4 * report_len * 4 + i * 4)
-                vec_y_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                vec_y_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=vec_y_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("vec_y_values", e)
-
-        try:
-            vec_z_values = np.zeros(report_len)
-            for i in range(report_len):
-                offset = int(50 + 5 * report_len * 4 + i * 4)
-                vec_z_hex = pp.extract_hex(
-                    BytesExtractInput(data=self.file_bytes, offset=offset, length=4)
-                )
-                vec_z_values[i] = pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=vec_z_hex, data_type="float", endian="little"
-                    )
-                )
-        except Exception as e:
-            raise FFTDecodeError("vec_z_values", e)
-
         velocity_data = {"x": vec_x_values, "y": vec_y_values, "z": vec_z_values}
 
-        try:
-            acc_x_padded = np.pad(
-                acceleration_data["x"],
-                [(0, int(fft_length - len(acceleration_data["x"])))],
-                mode="constant",
-            )
-            acc_y_padded = np.pad(
-                acceleration_data["y"],
-                [(0, int(fft_length - len(acceleration_data["y"])))],
-                mode="constant",
-            )
-            acc_z_padded = np.pad(
-                acceleration_data["z"],
-                [(0, int(fft_length - len(acceleration_data["z"])))],
-                mode="constant",
-            )
-        except Exception as e:
-            raise FFTDecodeError("acceleration_padding", e)
-
-        try:
-            vec_x_padded = np.pad(
-                velocity_data["x"],
-                [(0, int(fft_length - len(velocity_data["x"])))],
-                mode="constant",
-            )
-            vec_y_padded = np.pad(
-                velocity_data["y"],
-                [(0, int(fft_length - len(velocity_data["y"])))],
-                mode="constant",
-            )
-            vec_z_padded = np.pad(
-                velocity_data["z"],
-                [(0, int(fft_length - len(velocity_data["z"])))],
-                mode="constant",
-            )
-        except Exception as e:
-            raise FFTDecodeError("velocity_padding", e)
-
         self.fft_packet = PacketFFT(
-            data_type=int(data_type),
+            data_type=data_type,
             data_type_name=data_type_name,
-            data_length=int(data_length),
+            data_length=data_length,
             sensor_timestamp=timestamp,
             timestamp=datetime.now(timezone.utc),
-            fft_result=int(fft_result),
-            battery_level=int(battery_level),
+            fft_result=fft_result,
+            battery_level=battery_level,
             adcavg=int(adcavg),
             adclast=int(adclast),
             temperature=temperature,
@@ -459,21 +362,10 @@ class PacketFFTDecoder:
             oa_y=oa_y,
             oa_z=oa_z,
             freq_resolution=freq_resolution,
-            fft_length=int(fft_length),
+            fft_length=fft_length,
             report_len=report_len,
             reserved_bytes=reserved_bytes,
-            _acc_x_values=acceleration_data["x"],
-            _acc_y_values=acceleration_data["y"],
-            _acc_z_values=acceleration_data["z"],
-            _vec_x_values=velocity_data["x"],
-            _vec_y_values=velocity_data["y"],
-            _vec_z_values=velocity_data["z"],
-            acc_x_padded=acc_x_padded,
-            acc_y_padded=acc_y_padded,
-            acc_z_padded=acc_z_padded,
-            vec_x_padded=vec_x_padded,
-            vec_y_padded=vec_y_padded,
-            vec_z_padded=vec_z_padded,
+            signals=signals,
             velocity_data=velocity_data,
             acceleration_data=acceleration_data,
             freqs=np.arange(fft_length) * freq_resolution,
@@ -481,12 +373,34 @@ class PacketFFTDecoder:
 
         return self.fft_packet
 
-    def to_json(self) -> str:
+    @classmethod
+    def decode_batch(
+        cls, buffers: Iterable[Union[bytes, memoryview]]
+    ) -> list[PacketFFT]:
         """
-        Converts the FFTPacket instance to a JSON-serializable dictionary.
+        Decode several FFT packets, e.g. a backlog drained from a queue.
+
+        Packets of the same shape share one cached signal reader, so only the
+        first packet of each shape pays for building it.
+
+        Args:
+            buffers (Iterable[bytes | memoryview]): Raw binary packets
 
         Returns:
-            dict: A dictionary containing all FFTPacket data in a JSON-serializable format
+            list[PacketFFT]: Decoded packets, in input order
+        """
+        decoder = cls()
+        return [decoder.decode(file_bytes) for file_bytes in buffers]
+
+    def to_dict(self) -> dict:
+        """
+        Converts the FFTPacket instance to the dictionary written as JSON.
+
+        Array fields are returned as numpy arrays, not lists, so they can be
+        serialized straight from their buffers.
+
+        Returns:
+            dict: A dictionary containing all FFTPacket data
         """
 
         if self.fft_packet is None:
@@ -494,7 +408,11 @@ class PacketFFTDecoder:
                 "No FFT packet data available. Please decode the packet first."
             )
 
-        return json.dumps({
+        # Written as float64 so the stored JSON numbers read back to the
+        # same values as before the samples were held as float32
+        padded = self.fft_packet.signals.astype(np.float64)
+
+        return {
             "data_type": self.fft_packet.data_type,
             "data_type_name": self.fft_packet.data_type_name,
             "sensor_timestamp": self.fft_packet.sensor_timestamp.isoformat(),
@@ -503,31 +421,51 @@ class PacketFFTDecoder:
             "adcavg": self.fft_packet.adcavg,
             "adclast": self.fft_packet.adclast,
             "temperature": self.fft_packet.temperature,
-            "oa_x": float(self.fft_packet.oa_x),
-            "oa_y": float(self.fft_packet.oa_y),
-            "oa_z": float(self.fft_packet.oa_z),
-            "freq_resolution": float(self.fft_packet.freq_resolution),
+            "oa_x": self.fft_packet.oa_x,
+            "oa_y": self.fft_packet.oa_y,
+            "oa_z": self.fft_packet.oa_z,
+            "freq_resolution": self.fft_packet.freq_resolution,
             "fft_length": self.fft_packet.fft_length,
             "padded_acceleration_data": {
-                "x": self.fft_packet.acc_x_padded.tolist(),
-                "y": self.fft_packet.acc_y_padded.tolist(),
-                "z": self.fft_packet.acc_z_padded.tolist(),
+                "x": padded[0],
+                "y": padded[1],
+                "z": padded[2],
             },
             "padded_velocity_data": {
-                "x": self.fft_packet.vec_x_padded.tolist(),
-                "y": self.fft_packet.vec_y_padded.tolist(),
-                "z": self.fft_packet.vec_z_padded.tolist(),
+                "x": padded[3],
+                "y": padded[4],
+                "z": padded[5],
             },
-            "freqs": self.fft_packet.freqs.tolist(),
-        })
+            "freqs": self.fft_packet.freqs,
+        }
 
-    def plot(self):
+    def to_json(self) -> str:
         """
-        Plot FFT diagrams for acceleration and velocity data.
+        Converts the FFTPacket instance to a JSON string.
 
-        Creates a figure with 3 subplots (one for each axis) showing:
-        - RMS Acceleration (g)
-        - RMS Velocity (mm/s)
+        Returns:
+            str: Compact JSON encoding of to_dict()
+        """
+        return dumps_json(self.to_dict())
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Converts the FFTPacket instance to UTF-8 encoded JSON.
+
+        Returns:
+            bytes: Compact JSON encoding of to_dict()
+        """
+        return dumps_json_bytes(self.to_dict())
+
+    def to_output_record(self, sensor_name: str) -> dict:
+        """
+        Builds the record handed to the output tool for this packet.
+
+        Args:
+            sensor_name (str): Name of the sensor that sent the packet
+
+        Returns:
+            dict: Record with timestamp, sensor_name, data_type and json_value
         """
 
         if self.fft_packet is None:
@@ -535,45 +473,66 @@ class PacketFFTDecoder:
                 "No FFT packet data available. Please decode the packet first."
             )
 
-        # Calculate frequencies array
-        frequencies = (
-            np.arange(self.fft_packet.fft_length) * self.fft_packet.freq_resolution
-        )
-
-        # Calculate FFT values for acceleration data
-        fft_values_acc = {
-            "x": np.fft.fft(self.fft_packet.acc_x_padded),
-            "y": np.fft.fft(self.fft_packet.acc_y_padded),
-            "z": np.fft.fft(self.fft_packet.acc_z_padded),
+        return {
+            "timestamp": self.fft_packet.timestamp.isoformat(),
+            "sensor_name": sensor_name,
+            "data_type": self.fft_packet.data_type,
+            "json_value": self.to_json(),
         }
 
-        # Calculate FFT values for velocity data
-        fft_values_vec = {
-            "x": np.fft.fft(self.fft_packet.vec_x_padded),
-            "y": np.fft.fft(self.fft_packet.vec_y_padded),
-            "z": np.fft.fft(self.fft_packet.vec_z_padded),
-        }
+    def plot(self):
+        """
+        Plot FFT diagrams for acceleration and velocity data.
 
-        # Create subplot figure
-        fig, axs = plt.subplots(3, 1, figsize=(10, 15))
+        Creates a figure with 3 subplots (one for each axis) showing:
+        - RMS Acceleration (g)
+        - RMS Velocity (mm/s)
+        """
 
-        # Plot each axis
-        for i, axis in enumerate(["x", "y", "z"]):
-            axs[i].plot(
-                frequencies[: self.fft_packet.fft_length // 2],
-                np.abs(fft_values_acc[axis])[: self.fft_packet.fft_length // 2],
-                label="RMS Acceleration g",
-            )
-            axs[i].plot(
-                frequencies[: self.fft_packet.fft_length // 2],
-                np.abs(fft_values_vec[axis])[: self.fft_packet.fft_length // 2],
-                label="RMS Velocity mm/s",
+        if self.fft_packet is None:
+            raise ValueError(
+                "No FFT packet data available. Please decode the packet first."
             )
-            axs[i].set_title(f"FFT of Acceleration and Velocity Data ({axis}-axis)")
-            axs[i].set_xlabel("Frequency (Hz)")
-            axs[i].set_ylabel("Magnitude")
-            axs[i].grid()
-            axs[i].legend()
-
-        plt.tight_layout()
-        plt.show()
+
+        # Imported here so decoding never pays for loading matplotlib
+        import matplotlib.pyplot as plt
+
+        # Real input, so rfft computes only the fft_length // 2 + 1 unique bins
+        n_bins = self.fft_packet.fft_length // 2 + 1
+        frequencies = np.arange(n_bins) * self.fft_packet.freq_resolution
+
+        # All six axes are transformed in a single batched call, cached on the
+        # packet so repeated plots do not recompute it
+        magnitudes_acc = np.abs(self.fft_packet.fft_acc)
+        magnitudes_vec = np.abs(self.fft_packet.fft_vec)
+
+        # Create the subplot figure and its line artists once, unless its
+        # window has been closed in the meantime; later calls only swap the
+        # line data
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._axs = plt.subplots(3, 1, figsize=(10, 15))
+            self._lines = []
+            for i, axis in enumerate(["x", "y", "z"]):
+                (acc_line,) = self._axs[i].plot([], [], label="RMS Acceleration g")
+                (vec_line,) = self._axs[i].plot([], [], label="RMS Velocity mm/s")
+                self._lines.append((acc_line, vec_line))
+                self._axs[i].set_title(
+                    f"FFT of Acceleration and Velocity Data ({axis}-axis)"
+                )
+                self._axs[i].set_xlabel("Frequency (Hz)")
+                self._axs[i].set_ylabel("Magnitude")
+                self._axs[i].grid()
+                self._axs[i].legend()
+
+        # Update each axis
+        for i, (acc_line, vec_line) in enumerate(self._lines):
+            acc_line.set_data(frequencies, magnitudes_acc[i])
+            vec_line.set_data(frequencies, magnitudes_vec[i])
+            self._axs[i].relim()
+            self._axs[i].autoscale_view()
+
+        self._fig.tight_layout()
+        if plt.isinteractive():
+            self._fig.canvas.draw_idle()
+        else:
+            plt.show()
@@ -0,0 +1,54 @@
+"""
+Bulk reader for OA packets that returns their raw wire fields.
+
+decode_oa_batch is not a batch form of PacketOADecoder: its records hold the
+sensor epoch instead of a timestamp, ADC and temperature counts not yet
+divided by 1000, and the reserved bytes as they were sent. Callers that need
+PacketOAOnly values must convert them, e.g. with
+PacketProcessor.raw_to_timestamp. Nothing in the service calls it; it is
+meant for offline tools such as replaying captures or backfilling.
+"""
+from typing import Optional, Union
+
+import numpy as np
+
+# Record layout of one 50 byte OA packet, matching OA_HEADER and OA_READINGS
+# in packet_oa_only. Readings are left raw: the timestamp is the sensor epoch
+# value and adcavg, adclast and temperature are not yet divided by 1000.
+OA_DTYPE = np.dtype(
+    [
+        ("data_type", "i1"),
+        ("data_length", ">i4"),
+        ("raw_timestamp", "<u8"),
+        ("status", "i1"),
+        ("battery_level", "i1"),
+        ("raw_adcavg", "<i2"),
+        ("raw_adclast", "<i2"),
+        ("raw_temperature", "<i2"),
+        ("oa_x", "<f4"),
+        ("oa_y", "<f4"),
+        ("oa_z", "<f4"),
+        ("reserved", "V17"),
+    ]
+)
+
+
+def decode_oa_batch(
+    buffer: Union[bytes, memoryview], count: Optional[int] = None
+) -> np.ndarray:
+    """
+    Read consecutive OA packets from one contiguous buffer, e.g. for replaying
+    a capture file or backfilling stored payloads.
+
+    Args:
+        buffer (bytes | memoryview): Back to back 50 byte OA packets
+        count (int, optional): Number of packets to read; all whole packets in
+            the buffer when omitted
+
+    Returns:
+        np.ndarray: Structured array of raw OA_DTYPE records, a zero-copy view
+            into buffer (read-only when buffer is)
+    """
+    if count is None:
+        count = len(buffer) // OA_DTYPE.itemsize
+    return np.frombuffer(buffer, dtype=OA_DTYPE, count=count)
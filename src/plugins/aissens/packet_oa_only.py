@@ -1,24 +1,25 @@
-import json
+import struct
 from dataclasses import dataclass
 from datetime import datetime
-from typing import cast
+from typing import Union
 
-
-from src.plugins.aissens.packet_processor import (
-    BytesExtractInput,
-    HexToNumberInput,
-    HexToTimestampInput,
-    PacketProcessor,
-)
+from src.plugins.aissens.packet_processor import PacketProcessor
 from src.plugins.aissens.packet_common import (
-    DATA_TYPE_MAP,
+    DATA_TYPE_NAMES,
     DataTypeName,
+    PacketDecodeError,
+    dumps_json,
 )
 
-pp = PacketProcessor()
+
+# Fixed 50 byte OA packet, read with two precompiled structs: the data type
+# and big-endian data length, then the little-endian timestamp, readings and
+# reserved bytes. Single byte fields are signed as sent by the sensor.
+OA_HEADER = struct.Struct(">bi")
+OA_READINGS = struct.Struct("<Qbbhhhfff17s")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PacketOAOnly:
     """
     Data class representing an OA (Overall) packet with sensor data.
@@ -40,7 +41,8 @@ class PacketOAOnly:
         oa_x (float): Overall acceleration on X axis
         oa_y (float): Overall acceleration on Y axis
         oa_z (float): Overall acceleration on Z axis
-        reserved (int): Reserved value for future use
+        reserved_bytes (bytes): Reserved bytes for future use
+        reserved (str): Hexadecimal form of reserved_bytes, encoded on access
     """
 
     # Data type
@@ -72,10 +74,14 @@ class PacketOAOnly:
     oa_x: float
     oa_y: float
     oa_z: float
-    reserved: str
+    reserved_bytes: bytes
 
+    @property
+    def reserved(self) -> str:
+        return self.reserved_bytes.hex()
 
-class OADecodeError(Exception):
+
+class OADecodeError(PacketDecodeError):
     def __init__(self, field_name: str, original_error: Exception):
         self.field_name = field_name
         self.original_error = original_error
@@ -83,172 +89,67 @@ class OADecodeError(Exception):
 
 
 class PacketOADecoder:
-    def __init__(self, file_bytes: bytes):
-        self.file_bytes = file_bytes
+    def __init__(self, file_bytes: Union[bytes, memoryview, None] = None):
+        # Slices of a memoryview are zero-copy views into the payload. The
+        # payload may instead be passed to decode(), so one decoder can be
+        # reused for a stream of packets
+        self.file_bytes = None if file_bytes is None else memoryview(file_bytes)
         self.oa_packet: PacketOAOnly | None = None
+        # JSON of the decoded packet, built by the first to_json() call
+        self._json: str | None = None
+
+    @property
+    def packet(self) -> PacketOAOnly | None:
+        """The decoded packet, or None before decode() has run."""
+        return self.oa_packet
 
-    def decode(self) -> PacketOAOnly:
+    def decode(
+        self, file_bytes: Union[bytes, memoryview, None] = None
+    ) -> PacketOAOnly:
         """
         Decode the binary data into structured OA packet data.
         Raises OADecodeError with specific field information on failure.
-        """
-        try:
-            data_type_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=0, length=1)
-            )
-            data_type = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=data_type_hex, data_type="int", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("data_type", e)
 
-        try:
-            data_type_name = cast(
-                DataTypeName, DATA_TYPE_MAP.get(data_type, "Reserved")
-            )
-        except Exception as e:
-            raise OADecodeError("data_type_name", e)
+        Args:
+            file_bytes (bytes | memoryview, optional): Packet to decode in
+                place of the one given to the constructor
+        """
+        if file_bytes is not None:
+            self.file_bytes = memoryview(file_bytes)
+        if self.file_bytes is None:
+            raise ValueError("No packet data to decode.")
+        self.oa_packet = None
+        self._json = None
 
         try:
-            data_length_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=1, length=4)
-            )
-            data_length = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=data_length_hex, data_type="int", endian="big"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("data_length", e)
+            data_type, data_length = OA_HEADER.unpack_from(self.file_bytes, 0)
+            (
+                raw_timestamp,
+                status,
+                battery_level,
+                raw_adcavg,
+                raw_adclast,
+                raw_temperature,
+                oa_x,
+                oa_y,
+                oa_z,
+                reserved_bytes,
+            ) = OA_READINGS.unpack_from(self.file_bytes, 5)
+        except struct.error as e:
+            raise OADecodeError("header", e)
+
+        # data_type is unpacked signed; masking maps negative values onto the
+        # reserved range 128..255
+        data_type_name = DATA_TYPE_NAMES[data_type & 0xFF]
 
         try:
-            timestamp_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=5, length=8)
-            )
-            timestamp = pp.hex_to_timestamp(
-                HexToTimestampInput(hex_str=timestamp_hex, endian="little")
-            )
+            timestamp = PacketProcessor.raw_to_timestamp(raw_timestamp)
         except Exception as e:
             raise OADecodeError("timestamp", e)
 
-        try:
-            status_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=13, length=1)
-            )
-            status = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=status_hex, data_type="int", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("status", e)
-
-        try:
-            battery_level_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=14, length=1)
-            )
-            battery_level = int(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=battery_level_hex, data_type="int", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("battery_level", e)
-
-        try:
-            adcavg_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=15, length=2)
-            )
-            adcavg = pp.hex_to_number(
-                HexToNumberInput(hex_str=adcavg_hex, data_type="int", endian="little")
-            )
-            adcavg = adcavg / 1000
-        except Exception as e:
-            raise OADecodeError("adcavg", e)
-
-        try:
-            adclast_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=17, length=2)
-            )
-            adclast = pp.hex_to_number(
-                HexToNumberInput(hex_str=adclast_hex, data_type="int", endian="little")
-            )
-            adclast = adclast / 1000
-        except Exception as e:
-            raise OADecodeError("adclast", e)
-
-        try:
-            temperature_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=19, length=2)
-            )
-            temperature = pp.hex_to_number(
-                HexToNumberInput(
-                    hex_str=temperature_hex, data_type="int", endian="little"
-                )
-            )
-            temperature = temperature / 1000
-        except Exception as e:
-            raise OADecodeError("temperature", e)
-
-        try:
-            oa_x_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=21, length=4)
-            )
-            oa_x = float(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=oa_x_hex, data_type="float", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("oa_x", e)
-
-        try:
-            oa_y_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=25, length=4)
-            )
-            oa_y = float(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=oa_y_hex, data_type="float", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("oa_y", e)
-
-        try:
-            oa_z_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=29, length=4)
-            )
-            oa_z = float(
-                pp.hex_to_number(
-                    HexToNumberInput(
-                        hex_str=oa_z_hex, data_type="float", endian="little"
-                    )
-                )
-            )
-        except Exception as e:
-            raise OADecodeError("oa_z", e)
-
-        try:
-            reserved_hex = pp.extract_hex(
-                BytesExtractInput(data=self.file_bytes, offset=33, length=17)
-            )
-            reserved = reserved_hex
-        except Exception as e:
-            raise OADecodeError("reserved", e)
+        adcavg = raw_adcavg / 1000
+        adclast = raw_adclast / 1000
+        temperature = raw_temperature / 1000
 
         self.oa_packet = PacketOAOnly(
             data_type=data_type,
@@ -263,12 +164,12 @@ class PacketOADecoder:
             oa_x=oa_x,
             oa_y=oa_y,
             oa_z=oa_z,
-            reserved=reserved,
+            reserved_bytes=reserved_bytes,
         )
 
         return self.oa_packet
 
-    def to_json(self) -> str:
+    def to_dict(self) -> dict:
         """
         Converts the OAPacket instance to a JSON-serializable dictionary.
 
@@ -283,7 +184,7 @@ class PacketOADecoder:
                 "No packet data available. Please decode the packet first."
             )
 
-        return json.dumps({
+        return {
             "data_type": self.oa_packet.data_type,
             "data_type_name": self.oa_packet.data_type_name,
             "data_length": self.oa_packet.data_length,
@@ -293,8 +194,50 @@ class PacketOADecoder:
             "adcavg": self.oa_packet.adcavg,
             "adclast": self.oa_packet.adclast,
             "temperature": self.oa_packet.temperature,
-            "oa_x": float(self.oa_packet.oa_x),
-            "oa_y": float(self.oa_packet.oa_y),
-            "oa_z": float(self.oa_packet.oa_z),
+            "oa_x": self.oa_packet.oa_x,
+            "oa_y": self.oa_packet.oa_y,
+            "oa_z": self.oa_packet.oa_z,
             "reserved": self.oa_packet.reserved,
-        })
+        }
+
+    def to_json(self) -> str:
+        """
+        Converts the OAPacket instance to a JSON string.
+
+        The packet is immutable once decoded, so the string is built once and
+        returned again by later calls.
+
+        Returns:
+            str: Compact JSON encoding of to_dict()
+
+        Raises:
+            ValueError: If no packet data is available (packet not decoded yet)
+        """
+        if self._json is None:
+            self._json = dumps_json(self.to_dict())
+        return self._json
+
+    def to_output_record(self, sensor_name: str) -> dict:
+        """
+        Builds the record handed to the output tool for this packet.
+
+        Args:
+            sensor_name (str): Name of the sensor that sent the packet
+
+        Returns:
+            dict: Record with timestamp, sensor_name, data_type and json_value
+
+        Raises:
+            ValueError: If no packet data is available (packet not decoded yet)
+        """
+        if self.oa_packet is None:
+            raise ValueError(
+                "No packet data available. Please decode the packet first."
+            )
+
+        return {
+            "timestamp": self.oa_packet.timestamp.isoformat(),
+            "sensor_name": sensor_name,
+            "data_type": self.oa_packet.data_type,
+            "json_value": self.to_json(),
+        }
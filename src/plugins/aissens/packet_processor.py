@@ -1,60 +1,80 @@
 import struct
-from datetime import datetime
-from typing import Literal, Union
+import time
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Literal, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, field_validator
-
-
-class BytesInput(BaseModel):
-    data: bytes
-
-
-class BytesExtractInput(BaseModel):
-    data: bytes
+# Precompiled structs keyed by (endian, format character), so conversions do
+# not re-parse a format string on every call
+_ENDIAN_PREFIX = {"little": "<", "big": ">"}
+_STRUCTS = {
+    (endian, code): struct.Struct(prefix + code)
+    for endian, prefix in _ENDIAN_PREFIX.items()
+    for code in ("b", "h", "i", "q", "f", "Q")
+}
+_INT_CODES = {1: "b", 2: "h", 3: "i", 4: "i"}
+
+# Bound unpack functions per (endian, format character), resolved once so
+# conversions skip the Struct attribute lookup on every call
+_UNPACK = {key: st.unpack for key, st in _STRUCTS.items()}
+
+
+@lru_cache(maxsize=1)
+def _local_timezone(hour: int) -> Tuple[Optional[tzinfo], Optional[float]]:
+    """
+    Looks up the system's local timezone and its UTC offset in seconds.
+
+    Keyed by the current hour since the epoch, so the lookup runs once an
+    hour rather than per packet and still follows DST changes.
+    """
+    local_dt = datetime.now().astimezone()
+    local_tz = local_dt.tzinfo
+    if local_tz is None:
+        return None, None
+    offset = local_tz.utcoffset(local_dt)
+    return local_tz, None if offset is None else offset.total_seconds()
+
+
+# Inputs are only built inside this process, so they are plain slotted
+# dataclasses rather than validated models
+@dataclass(slots=True, frozen=True)
+class BytesInput:
+    data: Union[bytes, memoryview]
+
+
+@dataclass(slots=True, frozen=True)
+class BytesExtractInput:
+    data: Union[bytes, memoryview]
     offset: int
     length: int
 
 
-class HexToNumberInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class HexToNumberInput:
     hex_str: str
     data_type: Literal["float", "int"] = "float"
     endian: Literal["big", "little"] = "little"
 
-    @field_validator("data_type")
-    def validate_data_type(cls, v):
-        if v not in ["float", "int"]:
-            raise ValueError('data_type must be either "float" or "int"')
-        return v
 
-    @field_validator("endian")
-    def validate_endian(cls, v):
-        if v not in ["big", "little"]:
-            raise ValueError('endian must be either "big" or "little"')
-        return v
-
-
-class HexToTimestampInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class HexToTimestampInput:
     hex_str: str
     endian: Literal["big", "little"] = "little"
 
-    @field_validator("endian")
-    def validate_endian(cls, v):
-        if v not in ["big", "little"]:
-            raise ValueError('endian must be either "big" or "little"')
-        return v
-
 
 class PacketProcessor:
-    def __init__(self):
-        pass
+    # Stateless: every conversion is a staticmethod, callable on the class
+    # without creating an instance
 
-    def print_hex(self, input_data: BytesInput) -> None:
+    @staticmethod
+    def print_hex(input_data: BytesInput) -> None:
         """
         Prints bytes content in hexadecimal format.
 
         Args:
-            input_data (BytesInput): Pydantic model containing:
+            input_data (BytesInput): Dataclass containing:
                 - data (bytes): Bytes to be printed.
 
         Example:
@@ -65,12 +85,13 @@ class PacketProcessor:
         hex_content = input_data.data.hex()
         print(hex_content)
 
-    def extract_hex(self, input_data: BytesExtractInput) -> str:
+    @staticmethod
+    def extract_hex(input_data: BytesExtractInput) -> str:
         """
         Extracts a portion of bytes based on offset and length.
 
         Args:
-            input_data (BytesExtractInput): Pydantic model containing:
+            input_data (BytesExtractInput): Dataclass containing:
                 - data (bytes): Source bytes to extract from.
                 - offset (int): Starting position in bytes (zero-based).
                 - length (int): Number of bytes to extract.
@@ -83,17 +104,39 @@ class PacketProcessor:
             >>> processor.extract_hex(BytesExtractInput(data=b'\x01\x02\x03\x04', offset=1, length=2))
             '0203'
         """
-        content = input_data.data[
-            input_data.offset : input_data.offset + input_data.length
-        ]
-        return content.hex()
+        return PacketProcessor.extract_bytes(
+            input_data.data, input_data.offset, input_data.length
+        ).hex()
+
+    @staticmethod
+    def extract_bytes(
+        data: Union[bytes, memoryview], offset: int, length: int
+    ) -> Union[bytes, memoryview]:
+        """
+        Extracts a portion of bytes based on offset and length, without hex encoding.
+
+        Args:
+            data (bytes | memoryview): Source bytes to extract from.
+            offset (int): Starting position in bytes (zero-based).
+            length (int): Number of bytes to extract.
 
-    def hex_to_number(self, input_data: HexToNumberInput) -> Union[float, int]:
+        Returns:
+            bytes | memoryview: The extracted slice, of the same type as data.
+
+        Example:
+            >>> processor = PacketProcessor()
+            >>> processor.extract_bytes(b'\x01\x02\x03\x04', 1, 2)
+            b'\x02\x03'
+        """
+        return data[offset : offset + length]
+
+    @staticmethod
+    def hex_to_number(input_data: HexToNumberInput) -> Union[float, int]:
         """
         Converts hexadecimal string to a number (float or int).
 
         Args:
-            input_data (HexToNumberInput): Pydantic model containing:
+            input_data (HexToNumberInput): Dataclass containing:
                 - hex_str (str): Hexadecimal string (1 to 8 bytes)
                 - data_type (str): Type of number to convert to ('float' or 'int')
                 - endian (str): Byte order ('big' or 'little')
@@ -106,41 +149,30 @@ class PacketProcessor:
             >>> processor.hex_to_number(HexToNumberInput(hex_str='41200000', data_type='float'))
             10.0
         """
-        hex_str = input_data.hex_str
-        byte_data = bytes.fromhex(hex_str)
-        byte_length = len(byte_data)
-
-        # Define format string based on endianness
-        fmt = "<" if input_data.endian == "little" else ">"
-
-        # Add format specifier based on data type and byte length
-        if input_data.data_type == "float":
-            fmt += "f"  # single precision float (4 bytes)
+        byte_data = bytes.fromhex(input_data.hex_str)
+        code = PacketProcessor._format_code(input_data.data_type, len(byte_data))
+        # Integer codes already unpack to int and "f" to float
+        return _UNPACK[(input_data.endian, code)](byte_data)[0]
+
+    @staticmethod
+    def _format_code(data_type: str, byte_length: int) -> str:
+        """Returns the struct format character for a number of the given width."""
+        if data_type == "float":
             if byte_length != 4:
                 raise ValueError(
                     "Float conversion requires exactly 4 bytes (8 hex characters)"
                 )
-        else:  # int
-            if byte_length == 1:
-                fmt += "b"  # signed char (1 byte)
-            elif byte_length == 2:
-                fmt += "h"  # short (2 bytes)
-            elif byte_length <= 4:
-                fmt += "i"  # int (4 bytes)
-            else:
-                fmt += "q"  # long long (8 bytes)
-
-        # Unpack the bytes according to the format
-        value = struct.unpack(fmt, byte_data)[0]
-
-        return int(value) if input_data.data_type == "int" else value
+            return "f"
+        # signed char, short, int (up to 4 bytes), else long long
+        return _INT_CODES.get(byte_length, "q")
 
-    def hex_to_timestamp(self, input_data: HexToTimestampInput) -> datetime:
+    @staticmethod
+    def hex_to_timestamp(input_data: HexToTimestampInput) -> datetime:
         """
         Converts 8 bytes hex string to UTC timestamp.
 
         Args:
-            input_data (HexToTimestampInput): Pydantic model containing:
+            input_data (HexToTimestampInput): Dataclass containing:
                 - hex_str (str): Hexadecimal string (8 bytes/16 characters)
                 - endian (str): Byte order ('big' or 'little')
 
@@ -157,33 +189,39 @@ class PacketProcessor:
             raise ValueError("Hex string must be exactly 8 bytes (16 characters)")
 
         byte_data = bytes.fromhex(hex_str)
-        fmt = "<" if input_data.endian == "little" else ">"
-        fmt += "Q"  # unsigned long long (8 bytes)
+        # unsigned long long (8 bytes)
+        timestamp = _UNPACK[(input_data.endian, "Q")](byte_data)[0]
+        return PacketProcessor.raw_to_timestamp(timestamp)
+
+    @staticmethod
+    def raw_to_timestamp(timestamp: int) -> datetime:
+        """
+        Converts a raw sensor epoch value to a timestamp.
+
+        Args:
+            timestamp (int): Seconds since the epoch as reported by the sensor
 
-        timestamp = struct.unpack(fmt, byte_data)[0]
+        Returns:
+            datetime: Timestamp in the local timezone
+        """
         # Get the system's local timezone and offset
-        local_dt = datetime.now().astimezone()
-        local_tz = local_dt.tzinfo
-        if local_tz is not None:
-            offset = local_tz.utcoffset(local_dt)
-            if offset is not None:
-                offset_seconds = offset.total_seconds()
-                # Adjust the timestamp by subtracting the offset
-                corrected_timestamp = timestamp - offset_seconds
-                return datetime.fromtimestamp(corrected_timestamp, tz=local_tz)
-            else:
-                return datetime.fromtimestamp(timestamp, tz=ZoneInfo("UTC"))
+        local_tz, offset_seconds = _local_timezone(int(time.time() // 3600))
+        if local_tz is not None and offset_seconds is not None:
+            # Adjust the timestamp by subtracting the offset
+            corrected_timestamp = timestamp - offset_seconds
+            return datetime.fromtimestamp(corrected_timestamp, tz=local_tz)
         else:
             return datetime.fromtimestamp(timestamp, tz=ZoneInfo("UTC"))
 
-    def hex_to_temperature(self, input_data: HexToNumberInput) -> float:
+    @staticmethod
+    def hex_to_temperature(input_data: HexToNumberInput) -> float:
         """
         Converts hexadecimal string to temperature in Celsius.
         The formula used is:
             temperature = hex_value / 256.0 + 28
 
         Args:
-            input_data (HexToNumberInput): Pydantic model containing:
+            input_data (HexToNumberInput): Dataclass containing:
                 - hex_str (str): Hexadecimal string (1 to 2 bytes)
                 - endian (str): Byte order ('big' or 'little')
 
@@ -195,33 +233,34 @@ class PacketProcessor:
             >>> processor.hex_to_temperature(HexToNumberInput(hex_str='fded', data_type='float'))
             25.92
         """
-        hex_str = input_data.hex_str
-        byte_data = bytes.fromhex(hex_str)
-        byte_length = len(byte_data)
+        byte_data = bytes.fromhex(input_data.hex_str)
+        if len(byte_data) not in (1, 2):
+            raise ValueError("Temperature conversion requires 1 or 2 bytes")
+        code = PacketProcessor._format_code("int", len(byte_data))
+        value = _UNPACK[(input_data.endian, code)](byte_data)[0]
+        return PacketProcessor.raw_to_temperature(value)
 
-        # Define format string based on endianness
-        fmt = "<" if input_data.endian == "little" else ">"
+    @staticmethod
+    def raw_to_temperature(value: int) -> float:
+        """
+        Converts a raw signed temperature reading to Celsius.
 
-        # Add format specifier based on data type and byte length
-        if byte_length == 1:
-            fmt += "b"
-        elif byte_length == 2:
-            fmt += "h"
-        else:
-            raise ValueError("Temperature conversion requires 1 or 2 bytes")
-        # Unpack the bytes according to the format
-        value = struct.unpack(fmt, byte_data)[0]
-        # Convert to temperature
-        temperature = value / 256.0 + 28
-        return temperature
+        Args:
+            value (int): Raw temperature reading
 
-    def hex_to_adc(self, input_data: HexToNumberInput) -> float:
+        Returns:
+            float: Temperature in Celsius
+        """
+        return value / 256.0 + 28
+
+    @staticmethod
+    def hex_to_adc(input_data: HexToNumberInput) -> float:
         """
         Converts hexadecimal string to ADC value.
         The formula used is:
             adc_value = (hex_value - 1400) * 0.001547 + 2.7
         Args:
-            input_data (HexToNumberInput): Pydantic model containing:
+            input_data (HexToNumberInput): Dataclass containing:
                 - hex_str (str): Hexadecimal string (1 to 2 bytes)
                 - endian (str): Byte order ('big' or 'little')
         Returns:
@@ -231,22 +270,22 @@ class PacketProcessor:
             >>> processor.hex_to_adc(HexToNumberInput(hex_str='fded', data_type='float'))
             2.7
         """
-        hex_str = input_data.hex_str
-        byte_data = bytes.fromhex(hex_str)
-        byte_length = len(byte_data)
+        byte_data = bytes.fromhex(input_data.hex_str)
+        if len(byte_data) not in (1, 2):
+            raise ValueError("ADC conversion requires 1 or 2 bytes")
+        code = PacketProcessor._format_code("int", len(byte_data))
+        value = _UNPACK[(input_data.endian, code)](byte_data)[0]
+        return PacketProcessor.raw_to_adc(value)
 
-        # Define format string based on endianness
-        fmt = "<" if input_data.endian == "little" else ">"
+    @staticmethod
+    def raw_to_adc(value: int) -> float:
+        """
+        Converts a raw signed ADC reading to an ADC value.
 
-        # Add format specifier based on data type and byte length
-        if byte_length == 1:
-            fmt += "b"
-        elif byte_length == 2:
-            fmt += "h"
-        else:
-            raise ValueError("ADC conversion requires 1 or 2 bytes")
-        # Unpack the bytes according to the format
-        value = struct.unpack(fmt, byte_data)[0]
-        # Convert to ADC value
-        adc_value = (value - 1400) * 0.001547 + 2.7
-        return adc_value
+        Args:
+            value (int): Raw ADC reading
+
+        Returns:
+            float: ADC value
+        """
+        return (value - 1400) * 0.001547 + 2.7
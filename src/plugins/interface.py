@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any
+from typing import Any, Union
 
 
 class Plugin(ABC):
     @abstractmethod
-    def input(self, topic: str, payload: bytes, userdata: Any) -> None:
+    def input(
+        self, topic: str, payload: Union[bytes, memoryview], userdata: Any
+    ) -> None:
         raise NotImplementedError("Plugin must implement input method")
 
     @abstractmethod
     def _output(self, name: str, data: dict) -> None:
         raise NotImplementedError("Plugin must implement output method")
+
+    def close(self) -> None:
+        """Flush pending output and release resources on shutdown."""
+        pass
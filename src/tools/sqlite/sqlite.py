@@ -1,8 +1,12 @@
 import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import yaml
 
@@ -10,6 +14,50 @@ from src.tools.tools_interface import OutputInterface
 
 logger = logging.getLogger(__name__)
 
+# Connection pragmas applied to file-backed databases. WAL with synchronous=NORMAL
+# only syncs at checkpoints instead of twice per commit, which is what bounds
+# per-message insert throughput. Each can be overridden under database.pragmas.
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "wal_autocheckpoint": 1000,
+}
+
+# Default maximum number of queued rows written by the writer thread in one
+# transaction (database.batch_size), and default number of seconds the writer
+# waits for more rows before writing a partial batch (database.max_latency);
+# 0 writes whatever is queued as soon as the writer is free
+BATCH_SIZE = 500
+MAX_LATENCY = 0.0
+
+# Values of BLOB columns configured with `compress: true` are stored with a
+# one byte tag; values longer than COMPRESS_THRESHOLD bytes are zlib compressed
+COMPRESS_THRESHOLD = 512
+COMPRESS_TAG_RAW = b"\x00"
+COMPRESS_TAG_ZLIB = b"\x01"
+
+
+def compress_value(value):
+    """Encode a value for a compressed BLOB column."""
+    if value is None:
+        return None
+    raw = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+    if len(raw) > COMPRESS_THRESHOLD:
+        return COMPRESS_TAG_ZLIB + zlib.compress(raw, 3)
+    return COMPRESS_TAG_RAW + raw
+
+
+def decompress_value(value):
+    """Decode a value read back from a compressed BLOB column."""
+    if value is None:
+        return None
+    if value[:1] == COMPRESS_TAG_ZLIB:
+        return zlib.decompress(value[1:])
+    return bytes(value[1:])
+
 
 class Sqlite(OutputInterface):
     def __init__(self) -> None:
@@ -18,37 +66,79 @@ class Sqlite(OutputInterface):
         if not self.config.get("tables"):
             raise ValueError("No table schema defined in the configuration")
 
+        database_config = self.config.get("database", {})
+
+        # Writer batching: larger batches and a longer wait mean fewer commits
+        # at the cost of rows reaching the database later
+        self.batch_size = int(database_config.get("batch_size", BATCH_SIZE))
+        self.max_latency = float(database_config.get("max_latency", MAX_LATENCY))
+        if self.batch_size < 1:
+            raise ValueError(
+                f"database.batch_size must be at least 1, got {self.batch_size}"
+            )
+        if self.max_latency < 0:
+            raise ValueError(
+                f"database.max_latency must not be negative, got {self.max_latency}"
+            )
+
+        # Configured pragmas are interpolated into PRAGMA statements, so only
+        # plain names and integer or keyword values are accepted. YAML reads
+        # unquoted ON/OFF (and yes/no) as booleans, so those map back first
+        self.pragmas = {**PRAGMAS, **(database_config.get("pragmas") or {})}
+        for pragma, value in self.pragmas.items():
+            if isinstance(value, bool):
+                value = self.pragmas[pragma] = "ON" if value else "OFF"
+            if not str(pragma).isidentifier() or not (
+                (isinstance(value, int) and not isinstance(value, bool))
+                or (isinstance(value, str) and value.isidentifier())
+            ):
+                raise ValueError(f"Invalid SQLite pragma setting {pragma}: {value!r}")
+
         # Get path for database (support environment variables and relative paths)
-        db_path = self.config.get("database", {}).get("path", "data.db")
+        db_path = database_config.get("path", "data.db")
         
         # Expand environment variables with defaults if present in path
         db_path = os.path.expandvars(db_path)
         
+        # In-memory databases have no path to resolve and no journal to tune
+        in_memory = db_path == ":memory:"
+
         # If path is not absolute, make it relative to the module directory
-        if not os.path.isabs(db_path):
+        if not in_memory and not os.path.isabs(db_path):
             module_dir = os.path.dirname(os.path.abspath(__file__))
             db_path = os.path.join(module_dir, db_path)
             
         logger.info(f"Using database path: {db_path}")
 
-        # Create directory if it doesn't exist
-        db_dir = os.path.dirname(db_path)
-        if db_dir:
-            try:
-                os.makedirs(db_dir, exist_ok=True)
-                logger.info(f"Directory exists or created: {db_dir}")
-            except OSError as e:
-                logger.error(f"Failed to create directory {db_dir}: {e}")
-                raise
-
-        # Ensure directory is writable
-        if not os.access(db_dir, os.W_OK):
-            logger.error(f"No write permission in directory: {db_dir}")
-            raise PermissionError(f"No write permission in directory: {db_dir}")
+        if not in_memory:
+            # Create directory if it doesn't exist
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                try:
+                    os.makedirs(db_dir, exist_ok=True)
+                    logger.info(f"Directory exists or created: {db_dir}")
+                except OSError as e:
+                    logger.error(f"Failed to create directory {db_dir}: {e}")
+                    raise
+
+            # Ensure directory is writable
+            if not os.access(db_dir, os.W_OK):
+                logger.error(f"No write permission in directory: {db_dir}")
+                raise PermissionError(f"No write permission in directory: {db_dir}")
 
         try:
-            self.conn = sqlite3.connect(db_path)
-            self.conn.execute("PRAGMA journal_mode=WAL")  # Use Write-Ahead Logging for better concurrent access
+            # The connection is shared with the writer thread, which is the only
+            # thread issuing statements once __init__ has returned. Transactions
+            # are managed by hand so each batch is exactly one BEGIN/COMMIT
+            self.conn = sqlite3.connect(
+                db_path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            if not in_memory:
+                for pragma, value in self.pragmas.items():
+                    self.conn.execute(f"PRAGMA {pragma}={value}")
             logger.info(f"Connected to database: {db_path}")
             # Since connect() can create the file, explicitly log if this was a new database
             is_new_db = not os.path.exists(db_path) or os.path.getsize(db_path) == 0
@@ -61,8 +151,48 @@ class Sqlite(OutputInterface):
         self.tables: Dict[str, List[dict]] = {
             table["name"]: table["columns"] for table in self.config["tables"]
         }
+        self.table_indexes: Dict[str, List[str]] = {
+            table["name"]: table.get("indexes", []) for table in self.config["tables"]
+        }
+        # Positions (within the INSERT column order) of BLOB columns that are
+        # compressed by the writer thread
+        self.compressed_columns: Dict[str, List[int]] = {
+            table_name: [
+                i
+                for i, col in enumerate(c for c in columns if c["name"] != "id")
+                if col.get("compress")
+            ]
+            for table_name, columns in self.tables.items()
+        }
+        for table_name, columns in self.tables.items():
+            for col in columns:
+                if col.get("compress") and not col["type"].upper().startswith("BLOB"):
+                    raise ValueError(
+                        f"Column '{col['name']}' in table '{table_name}' is compressed but not a BLOB"
+                    )
+        # Per-column (name, accepted types, type name) checks in INSERT order,
+        # resolved from the schema once instead of on every output() call
+        self.column_validators: Dict[str, List[Tuple[str, tuple, str]]] = {
+            table_name: self._column_validators(table_name)
+            for table_name in self.tables
+        }
         self._init_tables()
 
+        # INSERT statements are built once so sqlite3's statement cache can
+        # reuse the prepared statement for every batch
+        self.insert_sql: Dict[str, str] = {
+            table_name: self._insert_sql(table_name) for table_name in self.tables
+        }
+
+        # Rows are validated on the caller's thread and written in batches by a
+        # background thread, so output() never waits on a commit
+        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        self._write_lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._writer_worker, daemon=True, name="sqlite-writer"
+        )
+        self._writer.start()
+
     def _load_config(self) -> dict:
         # Try to load configuration from the config directory
         config_path = Path(__file__).parent / "config" / "config.yaml"
@@ -103,77 +233,163 @@ class Sqlite(OutputInterface):
                 """
             )
 
+            # Create configured secondary indexes (e.g. for time range queries)
+            for index_column in self.table_indexes.get(table_name, []):
+                cursor.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS idx_{table_name}_{index_column}
+                    ON {table_name} ({index_column})
+                    """
+                )
+
         self.conn.commit()
 
     def output(self, name: str, *args, **kwargs) -> None:
-        if name not in self.tables:
+        validators = self.column_validators.get(name)
+        if validators is None:
             raise ValueError(f"Table '{name}' not defined in the configuration")
 
-        cursor = self.conn.cursor()
-
-        # Get schema columns (excluding id as it's auto-incrementing)
-        columns = [col for col in self.tables[name] if col["name"] != "id"]
-
-        # Validate all required columns are present in kwargs
-        for column in columns:
-            col_name = column["name"]
-            col_type = column["type"].upper()
-
+        # Validate every schema column (excluding id as it's auto-incrementing)
+        # and collect the values in the same order as the INSERT columns
+        values = []
+        for col_name, accepted, col_type in validators:
             if col_name not in kwargs:
                 raise ValueError(
                     f"Missing required column '{col_name}' in kwargs for table '{name}'"
                 )
 
-            # Validate type
             value = kwargs[col_name]
+            if not isinstance(value, accepted):
+                raise TypeError(
+                    f"Column '{col_name}' expects {col_type} but got {type(value)}"
+                )
+            values.append(value)
+
+        # Hand the row over to the writer thread
+        self._queue.put((name, tuple(values)))
+
+    def _column_validators(self, name: str) -> List[Tuple[str, tuple, str]]:
+        """Resolve the accepted Python types of each column of a configured table."""
+        validators = []
+        for column in self.tables[name]:
+            if column["name"] == "id":
+                continue
+            col_type = column["type"].upper()
 
-            # Type validation
             if col_type.startswith("TEXT"):
-                if not isinstance(value, (str, type(None))):
-                    raise TypeError(
-                        f"Column '{col_name}' expects TEXT but got {type(value)}"
-                    )
+                validators.append((column["name"], (str, type(None)), "TEXT"))
             elif col_type.startswith("INTEGER"):
-                if not isinstance(value, (int, type(None))):
-                    raise TypeError(
-                        f"Column '{col_name}' expects INTEGER but got {type(value)}"
-                    )
+                validators.append((column["name"], (int, type(None)), "INTEGER"))
             elif col_type.startswith("REAL"):
-                if not isinstance(value, (float, int, type(None))):
-                    raise TypeError(
-                        f"Column '{col_name}' expects REAL but got {type(value)}"
-                    )
+                validators.append((column["name"], (float, int, type(None)), "REAL"))
             elif col_type.startswith("BLOB"):
-                if not isinstance(value, (bytes, type(None))):
-                    raise TypeError(
-                        f"Column '{col_name}' expects BLOB but got {type(value)}"
-                    )
+                # Compressed columns also accept text, which is stored UTF-8 encoded
+                accepted = (
+                    (str, bytes, type(None))
+                    if column.get("compress")
+                    else (bytes, type(None))
+                )
+                validators.append((column["name"], accepted, "BLOB"))
             else:
                 raise ValueError(f"Unsupported column type: {col_type}")
 
-        # Prepare values dictionary
-        values = {}
-
-        # Build values dictionary according to schema
-        for column in columns:
-            col_name = column["name"]
-            values[col_name] = kwargs[col_name]
+        return validators
 
-        # Build SQL query
+    def _insert_sql(self, name: str) -> str:
+        """Build the INSERT statement for a configured table."""
+        columns = [col for col in self.tables[name] if col["name"] != "id"]
         columns_str = ", ".join(col["name"] for col in columns)
         placeholders = ", ".join(["?" for _ in columns])
 
-        insert_sql = f"""
+        return f"""
         INSERT INTO {name} ({columns_str})
         VALUES ({placeholders})
         """
 
-        # Get values in the same order as columns
-        values_tuple = tuple(values[col["name"]] for col in columns)
-
-        # Execute insert
-        cursor.execute(insert_sql, values_tuple)
-        self.conn.commit()
+    def _writer_worker(self) -> None:
+        """
+        Worker function for the writer thread.
+        Collects up to batch_size queued rows, waiting at most max_latency
+        seconds after the first one, and inserts them with one executemany
+        per table inside a single transaction.
+        """
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            rows_by_table: Dict[str, List[tuple]] = {}
+            for name, values_tuple in batch:
+                # Compression runs here so it stays off the caller's thread
+                compressed = self.compressed_columns[name]
+                if compressed:
+                    values = list(values_tuple)
+                    try:
+                        for i in compressed:
+                            values[i] = compress_value(values[i])
+                    except Exception as e:
+                        logger.error(f"Dropping row for table {name}, compression failed: {e}")
+                        continue
+                    values_tuple = tuple(values)
+                rows_by_table.setdefault(name, []).append(values_tuple)
+
+            self._write_batch(rows_by_table, len(batch))
+
+    def _write_batch(self, rows_by_table: Dict[str, List[tuple]], count: int) -> None:
+        """
+        Insert a drained batch inside one BEGIN IMMEDIATE transaction.
+        If the batch fails, it is rolled back and retried row by row so that
+        only the offending rows are dropped and the writer thread keeps running.
+        """
+        with self._write_lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                for name, rows in rows_by_table.items():
+                    self.conn.executemany(self.insert_sql[name], rows)
+                self.conn.execute("COMMIT")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to write batch of {count} rows, retrying row by row: {e}")
+                self._rollback()
+
+            for name, rows in rows_by_table.items():
+                for row in rows:
+                    try:
+                        # Autocommit, so each row is its own transaction
+                        self.conn.execute(self.insert_sql[name], row)
+                    except Exception as e:
+                        logger.error(f"Failed to insert row into {name}: {e}; row: {row!r:.200}")
+                        self._rollback()
+
+    def _rollback(self) -> None:
+        """Roll back the open transaction, if any, without raising."""
+        try:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to roll back transaction: {e}")
 
     def close(self) -> None:
-        self.conn.close()
+        # Let the writer flush everything queued before the sentinel
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._write_lock:
+            self.conn.close()
@@ -22,3 +22,12 @@ class OutputInterface(ABC):
                      # where "sensor_data" represents the table column to store the value
         """
         pass
+
+    def close(self) -> None:
+        """
+        Flush any pending output and release resources.
+
+        Called once on shutdown; tools that write synchronously need not
+        override it.
+        """
+        pass